@@ -5,9 +5,13 @@ A GUI application to crop wallpapers for multi-monitor setups with custom aspect
 
 import customtkinter as ctk
 from tkinter import filedialog
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageFont, ImageTk
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import logging
 import os
+import shutil
+import threading
 
 
 def setup_logging(level=logging.INFO):
@@ -22,9 +26,25 @@ def setup_logging(level=logging.INFO):
 logger = logging.getLogger(__name__)
 
 
+def _is_digits(text):
+    """Tk key validator for positive-integer entries (empty while editing)."""
+    return text == "" or text.isdigit()
+
+
+def _is_signed_digits(text):
+    """Tk key validator for integer entries that may start with a minus."""
+    return text in ("", "-") or text.removeprefix("-").isdigit()
+
+
+_SCREEN_COLORS = ("#CC9709", "#C74405", "#CC0058", "#692ECC", "#2F6ECC", "#080E24")
+
+
 class ScreenConfig:
     """Represents the configuration of a screen with aspect ratio and position."""
-    
+
+    __slots__ = ("id", "ratio_w", "ratio_h", "x", "y", "width", "height",
+                 "_apply_scaled")
+
     def __init__(self, screen_id, ratio_w=16, ratio_h=9, x=0, y=0):
         self.id = screen_id
         self.ratio_w = ratio_w
@@ -33,46 +53,47 @@ class ScreenConfig:
         self.y = y
         self.width = 1920
         self.height = 1080
-        self.color = self.generate_color(screen_id)
-    
-    def generate_color(self, screen_id):
-        """Generates a unique color for each screen."""
-        colors = ["#CC9709", "#C74405", "#CC0058", "#692ECC", "#2F6ECC", "#080E24"]
-        return colors[screen_id % len(colors)]
-    
+        self._select_apply()
+
+    @property
+    def color(self):
+        """Unique color for this screen, derived from its id."""
+        return _SCREEN_COLORS[self.id % len(_SCREEN_COLORS)]
+
     def get_ratio_string(self):
         """Returns the ratio as a string (e.g., '16:9')."""
         return f"{self.ratio_w}:{self.ratio_h}"
-    
+
     def get_box(self):
         """Returns coordinates for PIL crop (left, top, right, bottom)."""
         return (self.x, self.y, self.x + self.width, self.y + self.height)
-    
-    def calculate_resolution(self, ref_width, ref_height, scale_percent):
-        """
-        Calculates resolution based on reference and scale.
-        
-        Args:
-            ref_width: Reference width
-            ref_height: Reference height
-            scale_percent: Scale percentage (0-100)
-                          0% = ×0.5, 50% = ×1.0, 100% = ×2.0
+
+    def set_ratio(self, ratio_w, ratio_h):
+        """Sets the aspect ratio and re-selects the orientation formula."""
+        self.ratio_w = ratio_w
+        self.ratio_h = ratio_h
+        self._select_apply()
+
+    def _select_apply(self):
+        """Binds the resolution formula matching the current orientation.
+
+        Selecting the branch once per ratio change keeps the per-screen
+        recalculation down to a single multiply-and-round.
         """
-        scale_factor = 0.5 + (scale_percent / 100) * 1.5
-        max_ref_side = max(ref_width, ref_height)
-        scaled_max_side = max_ref_side * scale_factor
-        
         if self.ratio_w >= self.ratio_h:
-            self.width = round(scaled_max_side)
-            self.height = round(scaled_max_side * (self.ratio_h / self.ratio_w))
+            self._apply_scaled = self._apply_landscape
         else:
-            self.height = round(scaled_max_side)
-            self.width = round(scaled_max_side * (self.ratio_w / self.ratio_h))
-        
-        logger.debug(
-            f"Screen {self.id+1} ({self.ratio_w}:{self.ratio_h}): "
-            f"{self.width}x{self.height} (scale {scale_percent}%, factor {scale_factor:.2f})"
-        )
+            self._apply_scaled = self._apply_portrait
+
+    def _apply_landscape(self, scaled_max_side):
+        """Applies resolution for landscape (or square) orientation."""
+        self.width = round(scaled_max_side)
+        self.height = round(scaled_max_side * (self.ratio_h / self.ratio_w))
+
+    def _apply_portrait(self, scaled_max_side):
+        """Applies resolution for portrait orientation."""
+        self.height = round(scaled_max_side)
+        self.width = round(scaled_max_side * (self.ratio_w / self.ratio_h))
 
 
 class ScreenConfigWidget(ctk.CTkFrame):
@@ -87,18 +108,19 @@ class ScreenConfigWidget(ctk.CTkFrame):
     
     def create_widgets(self):
         """Creates the screen configuration interface."""
-        # Header
-        header_frame = ctk.CTkFrame(self, fg_color=self.screen_config.color)
-        header_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(
-            header_frame,
+        # Header (kept as attributes so renumbering can update them in place)
+        self.header_frame = ctk.CTkFrame(self, fg_color=self.screen_config.color)
+        self.header_frame.pack(fill="x", padx=5, pady=5)
+
+        self.header_label = ctk.CTkLabel(
+            self.header_frame,
             text=f"Screen {self.screen_config.id + 1}",
             font=("Arial", 14, "bold")
-        ).pack(side="left", padx=10, pady=5)
-        
+        )
+        self.header_label.pack(side="left", padx=10, pady=5)
+
         self.ratio_label = ctk.CTkLabel(
-            header_frame,
+            self.header_frame,
             text=f"{self.screen_config.get_ratio_string()} • "
                  f"{self.screen_config.width}x{self.screen_config.height}",
             font=("Arial", 12)
@@ -106,7 +128,7 @@ class ScreenConfigWidget(ctk.CTkFrame):
         self.ratio_label.pack(side="left", padx=10)
         
         delete_btn = ctk.CTkButton(
-            header_frame,
+            self.header_frame,
             text="Delete",
             width=100,
             command=self.delete_screen,
@@ -115,82 +137,112 @@ class ScreenConfigWidget(ctk.CTkFrame):
         )
         delete_btn.pack(side="right", padx=5)
         
-        # Screen ratio configuration
+        # Reject non-digit keystrokes at the widget level so they never
+        # reach update_config
+        digit_vcmd = (self.register(_is_digits), "%P")
+        signed_vcmd = (self.register(_is_signed_digits), "%P")
+
+        # Screen ratio configuration. grid places the whole row in one
+        # geometry pass instead of one pack relayout per child.
         ratio_frame = ctk.CTkFrame(self)
         ratio_frame.pack(fill="x", padx=10, pady=5)
-        
+        ratio_frame.grid_columnconfigure(tuple(range(6)), weight=0)
+
         ctk.CTkLabel(
-            ratio_frame, 
+            ratio_frame,
             text="Screen Ratio:",
             font=("Arial", 12, "bold")
-        ).pack(side="left", padx=5)
-        
-        ctk.CTkLabel(ratio_frame, text="Width:").pack(side="left", padx=5)
-        self.ratio_w_entry = ctk.CTkEntry(ratio_frame, width=60)
+        ).grid(row=0, column=0, padx=5, pady=5)
+
+        ctk.CTkLabel(ratio_frame, text="Width:").grid(row=0, column=1, padx=5)
+        self.ratio_w_entry = ctk.CTkEntry(
+            ratio_frame, width=60,
+            validate="key", validatecommand=digit_vcmd
+        )
         self.ratio_w_entry.insert(0, str(self.screen_config.ratio_w))
-        self.ratio_w_entry.pack(side="left", padx=5)
-        self.ratio_w_entry.bind("<KeyRelease>", lambda e: self.update_config())
-        
-        ctk.CTkLabel(ratio_frame, text=":").pack(side="left", padx=5)
-        
-        ctk.CTkLabel(ratio_frame, text="Height:").pack(side="left", padx=5)
-        self.ratio_h_entry = ctk.CTkEntry(ratio_frame, width=60)
+        self.ratio_w_entry.grid(row=0, column=2, padx=5)
+        self.ratio_w_entry.bind("<KeyRelease>", self._on_key)
+
+        ctk.CTkLabel(ratio_frame, text=":").grid(row=0, column=3, padx=5)
+
+        ctk.CTkLabel(ratio_frame, text="Height:").grid(row=0, column=4, padx=5)
+        self.ratio_h_entry = ctk.CTkEntry(
+            ratio_frame, width=60,
+            validate="key", validatecommand=digit_vcmd
+        )
         self.ratio_h_entry.insert(0, str(self.screen_config.ratio_h))
-        self.ratio_h_entry.pack(side="left", padx=5)
-        self.ratio_h_entry.bind("<KeyRelease>", lambda e: self.update_config())
-        
+        self.ratio_h_entry.grid(row=0, column=5, padx=5)
+        self.ratio_h_entry.bind("<KeyRelease>", self._on_key)
+
         # Position configuration
         position_frame = ctk.CTkFrame(self)
         position_frame.pack(fill="x", padx=10, pady=5)
-        
+        position_frame.grid_columnconfigure(tuple(range(5)), weight=0)
+
         ctk.CTkLabel(
-            position_frame, 
+            position_frame,
             text="Position:",
             font=("Arial", 12, "bold")
-        ).pack(side="left", padx=5)
-        
-        ctk.CTkLabel(position_frame, text="X:").pack(side="left", padx=5)
-        self.x_entry = ctk.CTkEntry(position_frame, width=100)
+        ).grid(row=0, column=0, padx=5, pady=5)
+
+        ctk.CTkLabel(position_frame, text="X:").grid(row=0, column=1, padx=5)
+        self.x_entry = ctk.CTkEntry(
+            position_frame, width=100,
+            validate="key", validatecommand=signed_vcmd
+        )
         self.x_entry.insert(0, str(self.screen_config.x))
-        self.x_entry.pack(side="left", padx=5)
-        self.x_entry.bind("<KeyRelease>", lambda e: self.update_config())
-        
-        ctk.CTkLabel(position_frame, text="Y:").pack(side="left", padx=5)
-        self.y_entry = ctk.CTkEntry(position_frame, width=100)
+        self.x_entry.grid(row=0, column=2, padx=5)
+        self.x_entry.bind("<KeyRelease>", self._on_key)
+
+        ctk.CTkLabel(position_frame, text="Y:").grid(row=0, column=3, padx=5)
+        self.y_entry = ctk.CTkEntry(
+            position_frame, width=100,
+            validate="key", validatecommand=signed_vcmd
+        )
         self.y_entry.insert(0, str(self.screen_config.y))
-        self.y_entry.pack(side="left", padx=5)
-        self.y_entry.bind("<KeyRelease>", lambda e: self.update_config())
+        self.y_entry.grid(row=0, column=4, padx=5)
+        self.y_entry.bind("<KeyRelease>", self._on_key)
         
         # Separator
         ctk.CTkFrame(self, height=2, fg_color="gray").pack(fill="x", padx=5, pady=10)
-    
+
+    def _on_key(self, event):
+        """Forwards entry keystrokes to update_config."""
+        self.update_config()
+
     def update_config(self):
         """Updates the screen configuration based on user input."""
-        try:
-            ratio_w = int(self.ratio_w_entry.get())
-            ratio_h = int(self.ratio_h_entry.get())
-            x = int(self.x_entry.get())
-            y = int(self.y_entry.get())
-            
-            if ratio_w <= 0 or ratio_h <= 0:
-                logger.error(f"Invalid ratio: {ratio_w}:{ratio_h}")
-                return
-            
-            self.screen_config.ratio_w = ratio_w
-            self.screen_config.ratio_h = ratio_h
-            self.screen_config.x = x
-            self.screen_config.y = y
-            
-            self.ratio_label.configure(
-                text=f"{self.screen_config.get_ratio_string()} • "
-                     f"{self.screen_config.width}x{self.screen_config.height}"
-            )
-            
-            self.on_update()
-            logger.info(f"Screen {self.screen_config.id + 1} updated automatically")
-            
-        except ValueError:
-            pass
+        ratio_w_text = self.ratio_w_entry.get()
+        ratio_h_text = self.ratio_h_entry.get()
+        x_text = self.x_entry.get()
+        y_text = self.y_entry.get()
+
+        # The validators only admit digits, so fields are either parseable
+        # or still being edited (empty / lone minus)
+        if not (ratio_w_text.isdigit() and ratio_h_text.isdigit()):
+            return
+        if not (x_text.removeprefix("-").isdigit() and
+                y_text.removeprefix("-").isdigit()):
+            return
+
+        ratio_w = int(ratio_w_text)
+        ratio_h = int(ratio_h_text)
+
+        if ratio_w <= 0 or ratio_h <= 0:
+            logger.error(f"Invalid ratio: {ratio_w}:{ratio_h}")
+            return
+
+        self.screen_config.set_ratio(ratio_w, ratio_h)
+        self.screen_config.x = int(x_text)
+        self.screen_config.y = int(y_text)
+
+        self.ratio_label.configure(
+            text=f"{self.screen_config.get_ratio_string()} • "
+                 f"{self.screen_config.width}x{self.screen_config.height}"
+        )
+
+        self.on_update()
+        logger.info(f"Screen {self.screen_config.id + 1} updated automatically")
     
     def delete_screen(self):
         """Deletes this screen."""
@@ -214,6 +266,7 @@ class GlobalConfigWidget(ctk.CTkFrame):
         self.ref_width = 2560
         self.ref_height = 1440
         self.scale_percent = 50
+        self._pending_change = None
         self.create_widgets()
     
     def create_widgets(self):
@@ -238,18 +291,26 @@ class GlobalConfigWidget(ctk.CTkFrame):
         
         input_frame = ctk.CTkFrame(ref_frame, fg_color="transparent")
         input_frame.pack(pady=5)
-        
-        self.ref_width_entry = ctk.CTkEntry(input_frame, width=80, height=30)
+
+        digit_vcmd = (self.register(_is_digits), "%P")
+
+        self.ref_width_entry = ctk.CTkEntry(
+            input_frame, width=80, height=30,
+            validate="key", validatecommand=digit_vcmd
+        )
         self.ref_width_entry.insert(0, str(self.ref_width))
         self.ref_width_entry.pack(side="left", padx=2)
-        self.ref_width_entry.bind("<KeyRelease>", lambda e: self.apply_reference())
-        
+        self.ref_width_entry.bind("<KeyRelease>", self._on_key)
+
         ctk.CTkLabel(input_frame, text="×", font=("Arial", 14)).pack(side="left", padx=5)
-        
-        self.ref_height_entry = ctk.CTkEntry(input_frame, width=80, height=30)
+
+        self.ref_height_entry = ctk.CTkEntry(
+            input_frame, width=80, height=30,
+            validate="key", validatecommand=digit_vcmd
+        )
         self.ref_height_entry.insert(0, str(self.ref_height))
         self.ref_height_entry.pack(side="left", padx=2)
-        self.ref_height_entry.bind("<KeyRelease>", lambda e: self.apply_reference())
+        self.ref_height_entry.bind("<KeyRelease>", self._on_key)
         
         # Scale slider
         scale_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -291,34 +352,48 @@ class GlobalConfigWidget(ctk.CTkFrame):
             text_color="gray"
         ).pack()
     
+    def _on_key(self, event):
+        """Forwards entry keystrokes to apply_reference."""
+        self.apply_reference()
+
     def apply_reference(self):
         """Applies the new reference resolution."""
-        try:
-            new_width = int(self.ref_width_entry.get())
-            new_height = int(self.ref_height_entry.get())
-            
-            if new_width <= 0 or new_height <= 0:
-                logger.error("Invalid reference resolution")
-                return
-            
-            self.ref_width = new_width
-            self.ref_height = new_height
-            
-            logger.info(f"New reference resolution: {self.ref_width}x{self.ref_height}")
-            self.on_change()
-            
-        except ValueError:
-            logger.error("Invalid values for reference resolution")
+        width_text = self.ref_width_entry.get()
+        height_text = self.ref_height_entry.get()
+
+        if not (width_text.isdigit() and height_text.isdigit()):
+            return
+
+        new_width = int(width_text)
+        new_height = int(height_text)
+
+        if new_width <= 0 or new_height <= 0:
+            logger.error("Invalid reference resolution")
+            return
+
+        self.ref_width = new_width
+        self.ref_height = new_height
+
+        logger.info(f"New reference resolution: {self.ref_width}x{self.ref_height}")
+        self.on_change()
     
     def on_slider_change(self, value):
         """Called when slider moves."""
         self.scale_percent = int(value)
         scale_factor = 0.5 + (self.scale_percent / 100) * 1.5
-        
+
         self.scale_info_label.configure(
             text=f"{self.scale_percent}% (×{scale_factor:.2f})"
         )
-        
+
+        # A drag fires once per pixel of travel; coalesce to ~12 Hz
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+        self._pending_change = self.after(80, self._fire_change)
+
+    def _fire_change(self):
+        """Runs the deferred change notification."""
+        self._pending_change = None
         self.on_change()
 
 
@@ -341,6 +416,23 @@ class WallpaperSplitterApp:
         self.background_image = None
         self.canvas_bg_image = None
         self.scale_factor = 1.0
+        self._pending_recalc = None
+        self._preview_src = None
+        self._resize_job = None
+        self._rgb = None
+        self._preview_pending = False
+        self._geom = np.empty((0, 4), dtype=np.int32)
+        self._bg_cache_key = None
+        self._bg_item = None
+        self._photo_a = None
+        self._photo_b = None
+        self._photo_which = 0
+        self._overlay_item = None
+        self._overlay_tk = None
+        try:
+            self._font = ImageFont.truetype("arial.ttf", 10)
+        except OSError:
+            self._font = ImageFont.load_default()
         
         self.create_widgets()
         logger.info("Application started")
@@ -446,6 +538,7 @@ class WallpaperSplitterApp:
             highlightthickness=0
         )
         self.preview_canvas.pack(fill="both", expand=True, padx=10, pady=10)
+        self.preview_canvas.bind("<Configure>", self.on_canvas_resize)
         
         self.help_text = self.preview_canvas.create_text(
             400, 300,
@@ -469,23 +562,53 @@ class WallpaperSplitterApp:
         
         if not file_path:
             return
-        
-        try:
-            self.image = Image.open(file_path)
-            self.image_path = file_path
-            
-            width, height = self.image.size
-            filename = os.path.basename(file_path)
-            
-            info_text = f"{filename}\n{width} × {height} pixels"
-            self.image_info_label.configure(text=info_text)
-            
-            self.update_preview_full()
-            logger.info(f"Image loaded: {filename} ({width}x{height})")
-            
-        except Exception as e:
-            self.image_info_label.configure(text="Loading error")
-            logger.error(f"Error loading image: {e}")
+
+        self.image_info_label.configure(text="Loading...")
+
+        # Decode in a worker thread so a large wallpaper does not freeze
+        # the GUI; results are marshaled back onto the Tk thread
+        def _worker():
+            try:
+                # Lazy open: only the header is read, giving us the full size
+                # without decoding; extraction re-decodes at full resolution
+                image = Image.open(file_path)
+
+                # Decode a downscaled copy for the preview. For JPEGs,
+                # draft() lets libjpeg decode directly at 1/2-1/8 scale.
+                preview = Image.open(file_path)
+                if os.path.splitext(file_path)[1].lower() in (".jpg", ".jpeg"):
+                    preview.draft("RGB", (1600, 1600))
+                preview.load()
+                preview.thumbnail((4096, 4096), Image.Resampling.LANCZOS)
+            except Exception as e:
+                logger.error(f"Error loading image: {e}")
+                self.root.after(
+                    0,
+                    lambda: self.image_info_label.configure(text="Loading error")
+                )
+                return
+
+            self.root.after(
+                0, lambda: self._on_image_ready(image, preview, file_path)
+            )
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_image_ready(self, image, preview, file_path):
+        """Installs a freshly loaded image. Runs on the Tk thread."""
+        self.image = image
+        self.image_path = file_path
+        self._preview_src = preview
+        self._rgb = None
+
+        width, height = image.size
+        filename = os.path.basename(file_path)
+
+        info_text = f"{filename}\n{width} × {height} pixels"
+        self.image_info_label.configure(text=info_text)
+
+        self.update_preview_full()
+        logger.info(f"Image loaded: {filename} ({width}x{height})")
     
     def add_screen(self):
         """Adds a new screen configuration."""
@@ -513,27 +636,16 @@ class WallpaperSplitterApp:
             self.screens.pop(index)
             widget = self.screen_widgets.pop(index)
             widget.destroy()
-            
-            # Reorganize IDs and colors
-            for i, screen in enumerate(self.screens):
+
+            # Renumber the survivors in place instead of rebuilding widgets
+            for i, (screen, widget) in enumerate(
+                zip(self.screens, self.screen_widgets)
+            ):
                 screen.id = i
-                screen.color = screen.generate_color(i)
-            
-            # Recreate widgets
-            for widget in self.screen_widgets:
-                widget.destroy()
-            self.screen_widgets.clear()
-            
-            for screen in self.screens:
-                widget = ScreenConfigWidget(
-                    self.screens_container,
-                    screen,
-                    on_update=self.on_screen_update,
-                    on_delete=self.delete_screen
-                )
-                widget.pack(fill="x", pady=10)
-                self.screen_widgets.append(widget)
-            
+                widget.header_frame.configure(fg_color=screen.color)
+                widget.header_label.configure(text=f"Screen {i + 1}")
+                widget.refresh_display()
+
             self.recalculate_all_resolutions()
             logger.info("Screen deleted")
             
@@ -542,12 +654,28 @@ class WallpaperSplitterApp:
     
     def on_screen_update(self):
         """Called when a screen configuration is modified."""
-        self.recalculate_all_resolutions()
-    
+        self.schedule_recalculation()
+
     def on_global_config_change(self):
         """Called when global configuration changes."""
+        self.schedule_recalculation()
+
+    def schedule_recalculation(self):
+        """Schedules a recalculation, coalescing rapid successive edits.
+
+        Typing "2560" fires four <KeyRelease> events; debouncing with
+        after/after_cancel collapses them into a single recalculation
+        and canvas redraw.
+        """
+        if self._pending_recalc is not None:
+            self.root.after_cancel(self._pending_recalc)
+        self._pending_recalc = self.root.after(80, self._do_recalc)
+
+    def _do_recalc(self):
+        """Runs the deferred recalculation."""
+        self._pending_recalc = None
         self.recalculate_all_resolutions()
-    
+
     def recalculate_all_resolutions(self):
         """Recalculates resolutions for all screens."""
         ref_width = self.global_config.ref_width
@@ -558,32 +686,79 @@ class WallpaperSplitterApp:
             f"Recalculating with ref={ref_width}x{ref_height}, scale={scale_percent}%"
         )
         
+        # Hoisted out of the per-screen loop: 0% = x0.5, 50% = x1.0, 100% = x2.0
+        scale_factor = 0.5 + scale_percent * 0.015
+        scaled_max_side = max(ref_width, ref_height) * scale_factor
+
         for screen in self.screens:
-            screen.calculate_resolution(ref_width, ref_height, scale_percent)
-        
+            screen._apply_scaled(scaled_max_side)
+
+        # Keep screen geometry in a (N, 4) array so draw_rectangles can map
+        # all boxes to canvas coordinates in one vectorized expression
+        self._geom = np.empty((len(self.screens), 4), dtype=np.int32)
+        for i, screen in enumerate(self.screens):
+            self._geom[i] = (
+                screen.x, screen.y,
+                screen.x + screen.width, screen.y + screen.height
+            )
+
         for widget in self.screen_widgets:
             widget.refresh_display()
         
         self.update_preview_rectangles()
     
-    def update_preview_full(self):
+    def on_canvas_resize(self, event):
+        """Handles canvas resize: fast redraw now, quality redraw on settle."""
+        if self.image is None:
+            return
+
+        # Cheap pass so the preview tracks the drag, then a LANCZOS pass
+        # once resize events stop for 150 ms
+        self.update_preview_full(resample=Image.Resampling.BILINEAR)
+
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(150, self._on_resize_settled)
+
+    def _retry_preview(self):
+        """Retries the preview update once the canvas has a real size."""
+        self._preview_pending = False
+        self.update_preview_full()
+
+    def _on_resize_settled(self):
+        """Runs the final high-quality redraw after resizing stops."""
+        self._resize_job = None
+        self.update_preview_full()
+
+    def update_preview_full(self, resample=Image.Resampling.LANCZOS):
         """Completely updates preview (background image + rectangles)."""
         logger.debug("Complete preview update...")
-        
+
         if self.image is None:
             logger.debug("No image")
             return
         
-        self.preview_canvas.delete("all")
-        self.preview_canvas.update()
-        
+        # update_idletasks flushes geometry without dispatching pending input
+        # events, which would re-enter update_config mid-refresh
+        self.preview_canvas.update_idletasks()
+
         canvas_width = self.preview_canvas.winfo_width()
         canvas_height = self.preview_canvas.winfo_height()
-        
+
         if canvas_width <= 1 or canvas_height <= 1:
-            self.root.after(100, self.update_preview_full)
+            if self._preview_pending:
+                return
+            self._preview_pending = True
+            self.root.after(100, self._retry_preview)
             return
-        
+
+        # Reuse the existing PhotoImage when nothing relevant changed:
+        # repeated PhotoImage allocation is the known Tk leak source
+        cache_key = (canvas_width, canvas_height, id(self.image), resample)
+        if cache_key == self._bg_cache_key:
+            self.update_preview_rectangles()
+            return
+
         # Calculate scale
         img_width, img_height = self.image.size
         scale_w = canvas_width / img_width
@@ -593,26 +768,53 @@ class WallpaperSplitterApp:
         new_width = int(img_width * self.scale_factor)
         new_height = int(img_height * self.scale_factor)
         
-        # Create background image
-        self.background_image = self.image.resize(
-            (new_width, new_height), 
-            Image.Resampling.LANCZOS
+        # Create background image from the cached thumbnail; target dimensions
+        # stay in full-image coordinates so the rectangle mapping is unchanged
+        self.background_image = self._preview_src.resize(
+            (new_width, new_height),
+            resample,
+            reducing_gap=2.0
         )
-        self.canvas_bg_image = ImageTk.PhotoImage(self.background_image)
-        
+        # Paste into the currently displayed PhotoImage when the size is
+        # unchanged; otherwise fill the other buffer and swap, so Tk never
+        # frees a bitmap that is still on screen (the Windows leak trigger)
+        current = self._photo_a if self._photo_which == 0 else self._photo_b
+        if (current is not None and
+                (current.width(), current.height()) == self.background_image.size):
+            current.paste(self.background_image)
+            self.canvas_bg_image = current
+        else:
+            fresh = ImageTk.PhotoImage(self.background_image)
+            self._photo_which ^= 1
+            if self._photo_which == 0:
+                self._photo_a = fresh
+            else:
+                self._photo_b = fresh
+            self.canvas_bg_image = fresh
+        self._bg_cache_key = cache_key
+
         # Center image
         self.x_offset = (canvas_width - new_width) // 2
         self.y_offset = (canvas_height - new_height) // 2
-        
-        # Display background
-        self.preview_canvas.create_image(
-            self.x_offset, self.y_offset,
-            anchor="nw",
-            image=self.canvas_bg_image,
-            tags="background"
-        )
-        
-        self.draw_rectangles()
+
+        # Display background, reusing the existing canvas item when possible
+        if self._bg_item is not None:
+            self.preview_canvas.itemconfigure(
+                self._bg_item, image=self.canvas_bg_image
+            )
+            self.preview_canvas.coords(
+                self._bg_item, self.x_offset, self.y_offset
+            )
+        else:
+            self.preview_canvas.delete("all")
+            self._bg_item = self.preview_canvas.create_image(
+                self.x_offset, self.y_offset,
+                anchor="nw",
+                image=self.canvas_bg_image,
+                tags="background"
+            )
+
+        self.update_preview_rectangles()
         logger.debug("Complete preview updated")
     
     def update_preview_rectangles(self):
@@ -621,59 +823,94 @@ class WallpaperSplitterApp:
             return
         
         logger.debug("Updating rectangles only...")
-        
-        self.preview_canvas.delete("rectangles")
-        self.preview_canvas.delete("labels")
-        
+
         self.draw_rectangles()
         logger.debug("Rectangles updated")
-    
+
     def draw_rectangles(self):
-        """Draws rectangles for all configured screens."""
+        """Draws all screen outlines and labels as a single canvas overlay.
+
+        Rendering everything into one RGBA image keeps the canvas at two
+        items total (background + overlay) instead of two per screen,
+        so redraw cost stays constant as screens are added.
+        """
         if not hasattr(self, 'x_offset') or not hasattr(self, 'y_offset'):
             return
-        
-        for screen in self.screens:
-            x1 = int(screen.x * self.scale_factor) + self.x_offset
-            y1 = int(screen.y * self.scale_factor) + self.y_offset
-            x2 = int((screen.x + screen.width) * self.scale_factor) + self.x_offset
-            y2 = int((screen.y + screen.height) * self.scale_factor) + self.y_offset
-            
-            self.preview_canvas.create_rectangle(
-                x1, y1, x2, y2,
+
+        canvas_width = self.preview_canvas.winfo_width()
+        canvas_height = self.preview_canvas.winfo_height()
+
+        overlay = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
+        offsets = np.array(
+            [self.x_offset, self.y_offset, self.x_offset, self.y_offset],
+            dtype=np.int32
+        )
+        scaled = (self._geom * self.scale_factor + offsets).astype(np.int32)
+
+        for screen, (x1, y1, x2, y2) in zip(self.screens, scaled):
+            draw.rectangle(
+                [int(x1), int(y1), int(x2), int(y2)],
                 outline=screen.color,
-                width=3,
-                tags="rectangles"
+                width=3
             )
-            
+
             label_text = (
                 f"Screen {screen.id + 1}\n"
                 f"{screen.ratio_w}:{screen.ratio_h}\n"
                 f"{screen.width}x{screen.height}\n"
                 f"({screen.x}, {screen.y})"
             )
-            self.preview_canvas.create_text(
-                x1 + 5, y1 + 5,
-                text=label_text,
-                anchor="nw",
+            draw.multiline_text(
+                (int(x1) + 5, int(y1) + 5),
+                label_text,
                 fill=screen.color,
-                font=("Arial", 10, "bold"),
-                tags="labels"
+                font=self._font
+            )
+
+        # Reuse the persistent overlay item and its PhotoImage buffer; only
+        # a canvas size change forces a new allocation
+        if (self._overlay_tk is not None and
+                (self._overlay_tk.width(), self._overlay_tk.height())
+                == overlay.size):
+            self._overlay_tk.paste(overlay)
+        else:
+            self._overlay_tk = ImageTk.PhotoImage(overlay)
+            if self._overlay_item is not None:
+                self.preview_canvas.itemconfigure(
+                    self._overlay_item, image=self._overlay_tk
+                )
+
+        if self._overlay_item is None:
+            self._overlay_item = self.preview_canvas.create_image(
+                0, 0,
+                anchor="nw",
+                image=self._overlay_tk,
+                tags="overlay"
             )
     
-    def get_unique_filename(self, base_path):
-        """Generates a unique filename by appending a number if needed."""
-        if not os.path.exists(base_path):
+    def get_unique_filename(self, base_path, existing):
+        """Generates a unique filename against a set of existing names.
+
+        Checking set membership instead of os.path.exists avoids one stat
+        syscall per candidate; the chosen name is added to the set so later
+        calls in the same run cannot pick it again.
+        """
+        name = os.path.basename(base_path)
+        if name not in existing:
+            existing.add(name)
             return base_path
-        
-        name, ext = os.path.splitext(base_path)
+
+        stem, ext = os.path.splitext(name)
         counter = 2
-        
-        while True:
-            new_path = f"{name}_{counter}{ext}"
-            if not os.path.exists(new_path):
-                return new_path
+
+        while f"{stem}_{counter}{ext}" in existing:
             counter += 1
+
+        unique = f"{stem}_{counter}{ext}"
+        existing.add(unique)
+        return os.path.join(os.path.dirname(base_path), unique)
     
     def extract_all(self):
         """Extracts all configured screen zones from the wallpaper."""
@@ -693,40 +930,116 @@ class WallpaperSplitterApp:
         if not output_folder:
             logger.info("Extraction cancelled by user")
             return
-        
+
+        # Crop and encode in a worker thread so the main loop stays responsive;
+        # PIL's encoders release the GIL, so a pool scales with core count.
+        threading.Thread(
+            target=self._extract_worker,
+            args=(output_folder,),
+            daemon=True
+        ).start()
+
+    def _extract_one(self, screen, output_folder, existing, names_lock):
+        """Crops and saves the zone of a single screen. Runs in a pool thread.
+
+        Bounds are already checked by the vectorized predicate in
+        _extract_worker; only in-bounds screens reach this method.
+        """
+        img_height, img_width = self._rgb.shape[:2]
+
+        ext = os.path.splitext(self.image_path)[1]
+        filename = f"wallpaper_screen_{screen.ratio_w}-{screen.ratio_h}{ext}"
+        filepath = os.path.join(output_folder, filename)
+        with names_lock:
+            filepath = self.get_unique_filename(filepath, existing)
+
+        # A screen covering the whole image needs no re-encode at all
+        if screen.get_box() == (0, 0, img_width, img_height):
+            shutil.copyfile(self.image_path, filepath)
+            logger.info(f"Screen {screen.id + 1} copied as-is: {filepath}")
+            return
+
+        # Slicing the decoded array is a zero-copy view; fromarray shares the
+        # buffer, so no pixels move until the encoder reads them
+        view = self._rgb[
+            screen.y:screen.y + screen.height,
+            screen.x:screen.x + screen.width
+        ]
+        cropped = Image.fromarray(view)
+
+        if ext.lower() in (".jpg", ".jpeg"):
+            cropped.save(
+                filepath, "JPEG",
+                quality=92, subsampling=1, optimize=False, progressive=False
+            )
+        elif ext.lower() == ".png":
+            cropped.save(filepath, "PNG", compress_level=1)
+        else:
+            cropped.save(filepath)
+        logger.info(f"Screen {screen.id + 1} extracted: {filepath}")
+
+    def _extract_worker(self, output_folder):
+        """Runs all extractions in a thread pool and reports back to the UI."""
         extracted_count = 0
         errors = []
-        
-        for screen in self.screens:
-            try:
-                img_width, img_height = self.image.size
-                
-                if (screen.x < 0 or screen.y < 0 or 
-                    screen.x + screen.width > img_width or 
-                    screen.y + screen.height > img_height):
-                    error_msg = f"Screen {screen.id + 1} exceeds image boundaries"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
-                    continue
-                
-                cropped = self.image.crop(screen.get_box())
-                
-                ext = os.path.splitext(self.image_path)[1]
-                filename = f"wallpaper_screen_{screen.ratio_w}-{screen.ratio_h}{ext}"
-                filepath = os.path.join(output_folder, filename)
-                filepath = self.get_unique_filename(filepath)
-                
-                cropped.save(filepath)
-                extracted_count += 1
-                
-                logger.info(f"Screen {screen.id + 1} extracted: {filepath}")
-                
-            except Exception as e:
-                error_msg = f"Error screen {screen.id + 1}: {e}"
+
+        # Full-resolution decode happens here, once per extraction run, from
+        # a fresh open: the preview handle only ever decoded a draft
+        with Image.open(self.image_path) as source:
+            self._rgb = np.asarray(source.convert("RGB"))
+
+        # One scandir snapshot replaces a stat call per filename candidate;
+        # the lock keeps concurrent name picks from colliding
+        existing = {entry.name for entry in os.scandir(output_folder)}
+        names_lock = threading.Lock()
+
+        # Check all boxes against the image bounds in one vectorized
+        # comparison; only in-bounds screens are submitted to the pool
+        img_height, img_width = self._rgb.shape[:2]
+        boxes = np.array(
+            [(s.x, s.y, s.x + s.width, s.y + s.height) for s in self.screens],
+            dtype=np.int32
+        )
+        valid = (
+            (boxes[:, 0] >= 0) & (boxes[:, 1] >= 0) &
+            (boxes[:, 2] <= img_width) & (boxes[:, 3] <= img_height)
+        )
+
+        to_extract = []
+        for screen, ok in zip(self.screens, valid):
+            if ok:
+                to_extract.append(screen)
+            else:
+                error_msg = f"Screen {screen.id + 1} exceeds image boundaries"
                 errors.append(error_msg)
-                logger.error(error_msg, exc_info=True)
-        
-        # Show result dialog
+                logger.error(error_msg)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(
+                    self._extract_one, screen, output_folder,
+                    existing, names_lock
+                ): screen
+                for screen in to_extract
+            }
+
+            for future in as_completed(futures):
+                screen = futures[future]
+                try:
+                    future.result()
+                    extracted_count += 1
+                except Exception as e:
+                    error_msg = f"Error screen {screen.id + 1}: {e}"
+                    errors.append(error_msg)
+                    logger.error(error_msg, exc_info=True)
+
+        # Dialog creation must happen on the Tk thread
+        self.root.after(
+            0, lambda: self._show_result(extracted_count, errors, output_folder)
+        )
+
+    def _show_result(self, extracted_count, errors, output_folder):
+        """Shows the extraction result dialog."""
         result_window = ctk.CTkToplevel(self.root)
         result_window.title("Extraction Result")
         result_window.geometry("500x300")